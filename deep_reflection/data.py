@@ -1,15 +1,25 @@
 import dataclasses as dc
+import functools
+import inspect
 import json
 from typing import (
     Any,
+    Callable,
     Collection,
+    List,
     Mapping,
+    Tuple,
     Type,
     TypeVar,
 )
 
 from util.reflection import is_collection_constructible, parse_typehint, TypeInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 __all__ = ["json_to_dataclass", "dict_to_dataclass"]
 
@@ -17,10 +27,17 @@ __all__ = ["json_to_dataclass", "dict_to_dataclass"]
 T = TypeVar("T")
 
 
-def json_to_dataclass(cls: Type[T], s: str) -> T:
+def json_to_dataclass(cls: Type[T], s: str, use_orjson: bool = False) -> T:
+    # orjson parses faster, but integers beyond 64 bits lose precision and NaN
+    # or Infinity are rejected, so it has to be asked for
     if not dc.is_dataclass(cls):
         raise TypeError
 
+    if use_orjson:
+        if orjson is None:
+            raise ImportError("use_orjson requires orjson to be installed")
+        return dict_to_dataclass(cls, orjson.loads(s))
+
     return dict_to_dataclass(cls, json.loads(s))
 
 
@@ -70,22 +87,52 @@ def _construct_generic_mapping(type_info: TypeInfo, raw_value: Mapping):
     )
 
 
-Missing = object()
+def _make_field_accessor(field: dc.Field) -> Callable[[Mapping], Any]:
+    name = field.name
+    convert = functools.partial(_construct_object, parse_typehint(field.type))
+    if field.default is not dc.MISSING:
+        default = field.default
+        return lambda raw: convert(raw[name]) if name in raw else default
+    if field.default_factory is not dc.MISSING:
+        factory = field.default_factory
+        return lambda raw: convert(raw[name]) if name in raw else factory()
+
+    def access_required(raw: Mapping) -> Any:
+        try:
+            raw_value = raw[name]
+        except KeyError:
+            raise TypeError(f"Missing required field {name!r}") from None
+        return convert(raw_value)
+
+    return access_required
+
+
+@functools.lru_cache(maxsize=None)
+def _field_plan(
+    cls: type,
+) -> Tuple[bool, Tuple[Tuple[str, Callable[[Mapping], Any]], ...]]:
+    fields = [field for field in dc.fields(cls) if field.init]
+    plan = tuple((field.name, _make_field_accessor(field)) for field in fields)
+    return _accepts_positional(cls, [name for name, _ in plan]), plan
+
+
+def _accepts_positional(cls: type, names: List[str]) -> bool:
+    # Positional arguments avoid building a kwargs dict for every object, but are
+    # only safe when the constructor takes exactly the fields in plan order. This
+    # is not the case for keyword-only fields or a hand-written `__init__`.
+    try:
+        parameters = inspect.signature(cls).parameters.values()
+    except (TypeError, ValueError):
+        return False
+
+    return [p.name for p in parameters] == names and all(
+        p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for p in parameters
+    )
 
 
 def _construct_dataclass(cls: Type[T], raw_obj: Mapping) -> T:
-    constructed = {}
-    for field in dc.fields(cls):
-        type_info = parse_typehint(field.type)
-        raw_value = raw_obj.get(field.name, Missing)
-        if raw_value is Missing:
-            if field.default is not dc.MISSING:
-                raw_value = field.default
-            elif field.default_factory is not dc.MISSING:
-                raw_value = field.default_factory()
-            else:
-                raise TypeError
-
-        constructed[field.name] = _construct_object(type_info, raw_value)
-
-    return cls(**constructed)
+    positional, plan = _field_plan(cls)
+    if positional:
+        return cls(*[access(raw_obj) for _, access in plan])
+    else:
+        return cls(**{name: access(raw_obj) for name, access in plan})
@@ -1,5 +1,7 @@
 import dataclasses as dc
+import functools
 from inspect import isabstract
+from types import GenericAlias
 from typing import (
     Any,
     ByteString,
@@ -19,6 +21,7 @@ from typing import (
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=1024)
 def is_real_collection(type_: type) -> bool:
     if not issubclass(type_, Collection):
         return False
@@ -27,10 +30,12 @@ def is_real_collection(type_: type) -> bool:
     return True
 
 
+@functools.lru_cache(maxsize=1024)
 def is_dict_compatible(type_: type) -> bool:
     return issubclass(type_, Mapping) and not isabstract(type_)
 
 
+@functools.lru_cache(maxsize=1024)
 def is_list_compatible(type_: type) -> bool:
     return (
         is_real_collection(type_)
@@ -39,6 +44,7 @@ def is_list_compatible(type_: type) -> bool:
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def is_collection_constructible(target_type: type, source_type: type) -> bool:
     if issubclass(source_type, target_type) and not isabstract(target_type):
         return True
@@ -50,24 +56,31 @@ def is_collection_constructible(target_type: type, source_type: type) -> bool:
     return False
 
 
-@dc.dataclass(frozen=True)
+@dc.dataclass(frozen=True, slots=True)
 class TypeInfo(Generic[T]):
     real_type: Type[T]
     hinted_type: Type[T]
     type_args: Tuple["TypeInfo", ...] = ()
     is_optional: bool = False
 
-    @property
-    def is_real_collection(self):
-        return is_real_collection(self.real_type)
-
-    @property
-    def is_mapping(self):
-        return issubclass(self.real_type, Mapping)
-
-    @property
-    def is_generic(self):
-        return len(self.type_args) > 0
+    # Derived from the fields above in `__post_init__`, these are read for every
+    # constructed value
+    is_real_collection: bool = dc.field(init=False, repr=False, compare=False)
+    is_mapping: bool = dc.field(init=False, repr=False, compare=False)
+    is_generic: bool = dc.field(init=False, repr=False, compare=False)
+    is_dataclass: bool = dc.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # `real_type` is not necessarily a class, e.g. for `Any`
+        is_class = isinstance(self.real_type, type)
+        object.__setattr__(
+            self, "is_real_collection", is_class and is_real_collection(self.real_type)
+        )
+        object.__setattr__(
+            self, "is_mapping", is_class and issubclass(self.real_type, Mapping)
+        )
+        object.__setattr__(self, "is_generic", len(self.type_args) > 0)
+        object.__setattr__(self, "is_dataclass", dc.is_dataclass(self.real_type))
 
     @property
     def key_type_info(self):
@@ -80,6 +93,7 @@ class TypeInfo(Generic[T]):
             raise TypeError
         if not issubclass(kti.real_type, Hashable):
             raise TypeError
+        return kti
 
     @property
     def value_type_info(self):
@@ -101,10 +115,6 @@ class TypeInfo(Generic[T]):
         except IndexError:
             raise TypeError
 
-    @property
-    def is_dataclass(self):
-        return dc.is_dataclass(self.real_type)
-
     def describes(self, obj: Any) -> bool:
         return isinstance(obj, self.real_type)
 
@@ -115,7 +125,11 @@ class TypeInfo(Generic[T]):
         return value if self.describes(value) else self.create(value)
 
 
+@functools.lru_cache(maxsize=None)
 def parse_typehint(hinted_type: Type[T]) -> TypeInfo[T]:
+    if isinstance(hinted_type, type) and not isinstance(hinted_type, GenericAlias):
+        return TypeInfo(real_type=hinted_type, hinted_type=hinted_type)
+
     real_type = get_origin(hinted_type)
     if not real_type:
         return TypeInfo(real_type=hinted_type, hinted_type=hinted_type)
@@ -1,4 +1,5 @@
 import datetime as dt
+import sys
 
 
 __all__ = [
@@ -23,14 +24,19 @@ def datetime_to_json(d: dt.datetime) -> str:
     return s
 
 
-def json_to_datetime(s: str) -> dt.datetime:
-    # Regular Python ISO format: 2021-04-23T09:05:16.157178+00:00
-    # ECMA-262 format:           2021-04-23T09:05:16.157Z
-    if s.endswith("Z"):
-        # Restore explicit zero offset
-        s = s[:-1] + "+00:00"
+if sys.version_info >= (3, 11):
+    # `fromisoformat` parses the "Z" UTC marker itself since Python 3.11
+    json_to_datetime = dt.datetime.fromisoformat
+else:
+
+    def json_to_datetime(s: str) -> dt.datetime:
+        # Regular Python ISO format: 2021-04-23T09:05:16.157178+00:00
+        # ECMA-262 format:           2021-04-23T09:05:16.157Z
+        if s.endswith("Z"):
+            # Restore explicit zero offset
+            s = s[:-1] + "+00:00"
 
-    return dt.datetime.fromisoformat(s)
+        return dt.datetime.fromisoformat(s)
 
 
 def time_to_json(t: dt.time) -> str:
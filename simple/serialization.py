@@ -3,17 +3,33 @@ import datetime as dt
 import enum
 import json
 from decimal import Decimal
-from functools import partial
-from types import FunctionType
-from typing import Any, Callable, Collection, Dict, List, Type, Union
+from functools import lru_cache, partial
+from types import FunctionType, GenericAlias
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from uuid import UUID
 
 import typing
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 __all__ = [
     "RecordSerializer",
     "SerializerTypeError",
+    "dataclass",
     "load_dict",
     "load_json",
     "register_dataclass",
@@ -34,11 +50,93 @@ class SerializerTypeError(TypeError):
     pass
 
 
+# Class attribute holding a `(serializer, class, decoder)` triple, so that `load_dict`
+# can reach the decoder of an already registered dataclass without the registry
+# lookups. The class is kept to tell it apart from subclasses inheriting the attribute.
+_DECODER_ATTR = "__dataload_decoder__"
+_NO_DECODER = (None, None, None)
+
+
+@lru_cache(maxsize=None)
+def _dataclass_field_types(class_type: Type) -> Tuple[Tuple[str, Any], ...]:
+    fields = [field for field in dc.fields(class_type) if field.init]
+    if any(_is_unresolved(field.type) for field in fields):
+        # String annotations (e.g. with `from __future__ import annotations`) and
+        # forward references have to be evaluated in the namespace of their module,
+        # only pay for `typing.get_type_hints` in that case
+        try:
+            type_hints = typing.get_type_hints(class_type)
+        except NameError:
+            # A class can refer to itself before its name is bound in the module,
+            # this happens when it is registered by the `dataclass` decorator
+            type_hints = typing.get_type_hints(
+                class_type, localns={class_type.__name__: class_type}
+            )
+        return tuple((field.name, type_hints[field.name]) for field in fields)
+
+    return tuple((field.name, field.type) for field in fields)
+
+
+@lru_cache(maxsize=None)
+def _is_dataclass_type(type_: Type) -> bool:
+    # `dc.is_dataclass` is a `hasattr` check, which is slow for the common case of
+    # a missing attribute and runs for every encoded value
+    return dc.is_dataclass(type_)
+
+
+def _is_plain_class(type_hint: Any) -> bool:
+    # Plain classes carry no type arguments, so typing's introspection can be
+    # skipped for them. `list[int]` passes the `isinstance` check on Python 3.10.
+    return isinstance(type_hint, type) and not isinstance(type_hint, GenericAlias)
+
+
+def _is_unresolved(type_hint: Any) -> bool:
+    if _is_plain_class(type_hint):
+        return False
+    elif isinstance(type_hint, (str, typing.ForwardRef)):
+        return True
+    elif typing.get_origin(type_hint) is typing.Annotated:
+        # `get_type_hints` strips the metadata down to the annotated type
+        return True
+    return any(_is_unresolved(arg) for arg in typing.get_args(type_hint))
+
+
+class _OptionalDecoder:
+    __slots__ = ("decoder",)
+
+    def __init__(self, decoder: Callable):
+        self.decoder = decoder
+
+    def __call__(self, raw: Any) -> Any:
+        return None if raw is None else self.decoder(raw)
+
+
 class RecordSerializer:
     _ALLOWED_CONTAINERS = frozenset({list, tuple, set, frozenset, dict})
 
-    def __init__(self):
+    def __init__(self, use_orjson: bool = False):
+        # orjson is faster than `json`, but it is opt-in because it does not accept
+        # every document `json` does: integers have to fit in 64 bits (larger ones
+        # are parsed as floats), and NaN and Infinity are rejected when loading and
+        # written as null when dumping
+        if use_orjson and orjson is None:
+            raise ImportError("use_orjson requires orjson to be installed")
+        self._use_orjson = use_orjson
         self._extra_types: Dict[Type, Dict[str, Callable]] = {}
+        # Encoders by exact type, on top of the registered types this holds the
+        # containers, the JSON native types and every type resolved so far
+        self._encoders: Dict[Type, Callable] = {
+            dict: self._encode_dict,
+            list: self._encode_collection,
+            tuple: self._encode_collection,
+            set: self._encode_collection,
+            frozenset: self._encode_collection,
+            str: self._identity,
+            int: self._identity,
+            float: self._identity,
+            bool: self._identity,
+            type(None): self._identity,
+        }
         self.register_type(UUID, encoder=str, decoder=UUID)
         self.register_type(Decimal, encoder=str, decoder=Decimal)
         self.register_type(
@@ -56,6 +154,9 @@ class RecordSerializer:
             "encoder": encoder,
             "decoder": decoder,
         }
+        self._encoders[type_] = encoder
+        if dc.is_dataclass(type_):
+            setattr(type_, _DECODER_ATTR, (self, type_, decoder))
 
     def register_dataclass(self, class_type: Type):
         if not dc.is_dataclass(class_type):
@@ -67,10 +168,20 @@ class RecordSerializer:
             self.register_type(type_, entry["encoder"], entry["decoder"])
 
     def serialize_to_json(self, obj: Any, **kwargs) -> str:
-        return json.dumps(self.serialize_to_dict(obj), **kwargs)
+        data = self.serialize_to_dict(obj)
+        # orjson has a fixed set of options, fall back to `json` for any keyword
+        # arguments meant for `json.dumps`
+        if self._use_orjson and not kwargs:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits, which `json` can still represent
+                pass
+
+        return json.dumps(data, **kwargs)
 
     def serialize_to_dict(self, obj: Any) -> Dict[str, Any]:
-        if not dc.is_dataclass(obj):
+        if not _is_dataclass_type(type(obj)):
             raise SerializerTypeError(
                 f"Cannot serialize type {type(obj)}, not a dataclass"
             )
@@ -78,9 +189,16 @@ class RecordSerializer:
         return self._encode_dataclass(obj)
 
     def load_json(self, class_type: Type, raw: str, **kwargs) -> Any:
+        if self._use_orjson and not kwargs:
+            return self.load_dict(class_type, orjson.loads(raw))
+
         return self.load_dict(class_type, json.loads(raw, **kwargs))
 
     def load_dict(self, class_type: Type, raw: Dict[str, Any]) -> Any:
+        owner, owner_type, decoder = getattr(class_type, _DECODER_ATTR, _NO_DECODER)
+        if owner is self and owner_type is class_type:
+            return decoder(raw)
+
         if not dc.is_dataclass(class_type):
             raise SerializerTypeError(
                 f"Cannot decode type {class_type}, not a dataclass"
@@ -100,19 +218,23 @@ class RecordSerializer:
         return result
 
     def _encode_value(self, obj: Any) -> Any:
-        type_ = type(obj)
-        if type_ in self._extra_types:
-            return self._extra_types[type(obj)]["encoder"](obj)
-        elif issubclass(type_, enum.Enum):
-            return obj.value
-        elif type_ is dict:
-            return self._encode_dict(obj)
-        elif type_ in self._ALLOWED_CONTAINERS:
-            return self._encode_collection(obj)
-        elif dc.is_dataclass(type_):
-            return self._encode_dataclass(obj)
+        encoder = self._encoders.get(type(obj))
+        if encoder is None:
+            encoder = self._resolve_encoder(type(obj))
+        return encoder(obj)
+
+    def _resolve_encoder(self, type_: Type) -> Callable:
+        # Types without an explicit encoder are resolved once and remembered,
+        # registering a type later on overrides the resolved encoder
+        if issubclass(type_, enum.Enum):
+            encoder = self._encode_enum
+        elif _is_dataclass_type(type_):
+            encoder = self._encode_dataclass
         else:
-            return obj
+            encoder = self._identity
+
+        self._encoders[type_] = encoder
+        return encoder
 
     def _encode_dict(self, obj: Dict[Any, Any]) -> Dict[Any, Any]:
         return {self._encode_value(k): self._encode_value(v) for k, v in obj.items()}
@@ -134,16 +256,24 @@ class RecordSerializer:
         # We need to construct and keep track of the decoder func first,
         # so that we can refer to it in case we encounter a recursive reference
         # down the line (e.g. a class `Person` having a field `friends` of type `List[Person]`)
-        field_decoders = {}
-        decoder_func = partial(self.decode_dataclass, class_type, field_decoders)
+        field_decoders: Dict[str, Callable] = {}
+
+        def decoder_func(raw: Dict[str, Any]) -> Any:
+            # Only reachable through recursive references, forwards to the compiled
+            # decoder once it exists
+            return compiled_decoder(raw)
+
         in_construction[class_type] = {
             "encoder": self._encode_dataclass,
             "decoder": decoder_func,
         }
 
-        for field_name, field_type in typing.get_type_hints(class_type).items():
+        for field_name, field_type in _dataclass_field_types(class_type):
             field_type = self._unwrap_alias(field_type)
-            original_type = self._unwrap_alias(typing.get_origin(field_type))
+            if _is_plain_class(field_type):
+                original_type = None
+            else:
+                original_type = self._unwrap_alias(typing.get_origin(field_type))
             if original_type is None:
                 if field_type in self._ALLOWED_CONTAINERS:
                     raise SerializerTypeError(
@@ -175,7 +305,53 @@ class RecordSerializer:
                     field_type, original_type, in_construction
                 )
 
-        return decoder_func
+        compiled_decoder = self._compile_dataclass_decoder(class_type, field_decoders)
+        in_construction[class_type]["decoder"] = compiled_decoder
+        return compiled_decoder
+
+    def _compile_dataclass_decoder(
+        self,
+        class_type: Type,
+        field_decoders: Dict[str, Callable],
+    ) -> Callable:
+        # Generate a straight-line function instead of looping over the field
+        # decoders for every record, e.g. for a class with fields `x: int` and
+        # `y: Optional[Foo]`:
+        #
+        #   def decode(raw, _cls=_cls, _f1=_f1):
+        #       return _cls(
+        #           x=raw['x'], y=None if (_v1 := raw['y']) is None else _f1(_v1)
+        #       )
+        #
+        # Decoders are bound as default arguments, so they are looked up as locals
+        namespace: Dict[str, Any] = {"_cls": class_type}
+        params = ["raw", "_cls=_cls"]
+        args = []
+        for i, (field_name, decoder) in enumerate(field_decoders.items()):
+            key = repr(field_name)
+            # The None check of optional fields is inlined, no need to call through
+            # the wrapper
+            optional = isinstance(decoder, _OptionalDecoder)
+            if optional:
+                decoder = decoder.decoder
+            if decoder is self._identity:
+                value = f"raw[{key}]"
+            elif optional:
+                value = f"None if (_v{i} := raw[{key}]) is None else _f{i}(_v{i})"
+            else:
+                value = f"_f{i}(raw[{key}])"
+
+            if decoder is not self._identity:
+                namespace[f"_f{i}"] = decoder
+                params.append(f"_f{i}=_f{i}")
+            args.append(f"{field_name}={value}")
+
+        source = (
+            f"def decode({', '.join(params)}):\n"
+            f"    return _cls({', '.join(args)})\n"
+        )
+        exec(compile(source, "<decoder>", "exec"), namespace)
+        return namespace["decode"]
 
     def _make_scalar_decoder(
         self,
@@ -193,7 +369,7 @@ class RecordSerializer:
             decoder_func = self._identity
 
         if optional:
-            return lambda raw: None if raw is None else decoder_func(raw)
+            return _OptionalDecoder(decoder_func)
         else:
             return decoder_func
 
@@ -219,17 +395,29 @@ class RecordSerializer:
                 self._unwrap_alias(value_type), in_construction
             )
 
-            decoder_func = partial(self.decode_dict, key_decoder, value_decoder)
+            if key_decoder is self._identity and value_decoder is self._identity:
+                decoder_func = dict
+            else:
+                decoder_func = partial(self.decode_dict, key_decoder, value_decoder)
         else:
             element_type = self._unwrap_alias(typing.get_args(field_type)[0])
             element_decoder = self._make_scalar_decoder(element_type, in_construction)
 
-            decoder_func = partial(
-                self.decode_collection, original_field_type, element_decoder
-            )
+            # Build lists and tuples from a list comprehension, which is faster than
+            # consuming a generator
+            if element_decoder is self._identity:
+                decoder_func = original_field_type
+            elif original_field_type is list:
+                decoder_func = partial(self.decode_list, element_decoder)
+            elif original_field_type is tuple:
+                decoder_func = partial(self.decode_tuple, element_decoder)
+            else:
+                decoder_func = partial(
+                    self.decode_collection, original_field_type, element_decoder
+                )
 
         if optional:
-            return lambda raw: None if raw is None else decoder_func(raw)
+            return _OptionalDecoder(decoder_func)
         else:
             return decoder_func
 
@@ -261,6 +449,10 @@ class RecordSerializer:
 
         return class_type(**params)
 
+    @staticmethod
+    def _encode_enum(obj: enum.Enum) -> Any:
+        return obj.value
+
     @staticmethod
     def decode_enum(enum_type: Type, raw: Any) -> Any:
         return enum_type(raw)
@@ -277,6 +469,16 @@ class RecordSerializer:
     ) -> Collection[Any]:
         return collection_factory(element_decoder(e) for e in raw)
 
+    @staticmethod
+    def decode_list(element_decoder: Callable, raw: Collection[Any]) -> List[Any]:
+        return [element_decoder(e) for e in raw]
+
+    @staticmethod
+    def decode_tuple(
+        element_decoder: Callable, raw: Collection[Any]
+    ) -> Tuple[Any, ...]:
+        return tuple([element_decoder(e) for e in raw])
+
 
 _default_serializer = RecordSerializer()
 
@@ -287,3 +489,15 @@ load_dict = _default_serializer.load_dict
 register_type = _default_serializer.register_type
 register_dataclass = _default_serializer.register_dataclass
 
+
+def dataclass(cls: Optional[Type] = None, /, **kwargs) -> Any:
+    # Drop-in for `dataclasses.dataclass` that also registers the class with the
+    # default serializer, so its decoder is built at import time instead of on the
+    # first `load_dict` call. Classes referenced by its fields have to be defined
+    # before it.
+    def wrap(cls: Type) -> Type:
+        cls = dc.dataclass(cls, **kwargs)
+        register_dataclass(cls)
+        return cls
+
+    return wrap if cls is None else wrap(cls)